@@ -9,14 +9,17 @@ import sys
 import subprocess
 import shutil
 import tempfile
+import time
+import plistlib
+import hashlib
+import functools
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
 # ─── Config ───────────────────────────────────────────────────────────────────
 APP_PATH   = os.path.expanduser(
     "~/Documents/Thomas/noirdesktop/noir-tauri/src-tauri/target/release/bundle/macos/Hean.app"
 )
-ICON_PATH  = os.path.expanduser(
-    "~/Documents/Thomas/noirdesktop/noir-tauri/src-tauri/icons/icon.png"
-)
 OUT_DMG    = os.path.expanduser(
     "~/Documents/Thomas/noirdesktop/noir-tauri/src-tauri/target/release/bundle/dmg/Hean_0.2.0-beta.1_aarch64.dmg"
 )
@@ -31,89 +34,170 @@ APP_ICON_Y   = 170
 APPS_ICON_X  = 515
 APPS_ICON_Y  = 170
 
+# Format du DMG final : UDZO (zlib, compatible partout) ou ULFO (LZFSE, plus
+# rapide) / ULMO (LZMA, plus compact). zlib-level=9 coûte 3–5× le temps du
+# niveau 6 pour <1 % de gain sur des binaires Mach-O.
+DMG_FORMAT   = os.environ.get("NOIR_DMG_FORMAT", "UDZO")
+ZLIB_LEVEL   = 6
+
 # ─── 1. Générer le background PNG (1x, 700×390) ───────────────────────────────
-def generate_background():
-    try:
-        from PIL import Image, ImageDraw
-        import numpy as np
-    except ImportError:
-        subprocess.run([sys.executable, "-m", "pip", "install", "pillow", "numpy", "-q"], check=True)
-        from PIL import Image, ImageDraw
-        import numpy as np
+def _build_key(*extra):
+    """Empreinte des entrées du style DMG : dimensions, positions, ce script
+    et les éventuelles entrées supplémentaires (`extra`)."""
+    h = hashlib.sha1(repr((WIN_W, WIN_H, APP_ICON_X, APP_ICON_Y, APPS_ICON_X, APPS_ICON_Y, extra)).encode())
+    with open(os.path.abspath(__file__), "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()[:12]
+
+
+@functools.lru_cache(maxsize=8)
+def _font(path, size):
+    """ImageFont.truetype mémoïsé : chaque appel re-parse le fichier TTF/TTC."""
+    from PIL import ImageFont
+    return ImageFont.truetype(path, size)
+
+
+def _glows(W, H):
+    """Dual glow (profondeur 2026) : (cx, cy, sx, sy, k, gain) → exp(-k·dist)·gain."""
+    return [
+        # Glow 1 — large, très subtil (ambiance)
+        (W / 2, H / 2, W / 1.6, H / 1.2, 2.0, 10),
+        # Glow 2 — concentré, légèrement plus fort (focus central)
+        (W / 2, H * 0.45, W / 3.0, H / 2.0, 1.8, 8),
+    ]
+
+
+def _base_layer_numpy(W, H):
+    """Base noire + glow + grain (plan L), calculés en float32 avec NumPy."""
+    import numpy as np
+    from PIL import Image
+
+    # Axes 1-D (float32) broadcastés en (H, W) — pas de mgrid H×W
+    xs = np.arange(W, dtype=np.float32)
+    ys = np.arange(H, dtype=np.float32)[:, None]
+
+    # Fond en niveaux de gris : un seul plan (H, W), étendu en RGB à la fin
+    plane = np.zeros((H, W), dtype=np.int16)
+    for cx, cy, sx, sy, k, gain in _glows(W, H):
+        vx = ((xs - cx) / sx) ** 2
+        vy = ((ys - cy) / sy) ** 2
+        g = np.sqrt(vx + vy)
+        np.multiply(g, -k, out=g)
+        np.exp(g, out=g)
+        g *= gain
+        # Cast float32 → int16 tronqué directement dans le plan (pas de temporaire uint8)
+        np.add(plane, g, out=plane, casting="unsafe")
+
+    # Grain texturé (plus prononcé pour le côté tactile 2026) — monochrome
+    rng = np.random.default_rng(42)
+    # int16 et non int8 : Generator.integers est plus lent en int8 (~25 %)
+    plane += rng.integers(-6, 7, (H, W), dtype=np.int16)
+    np.clip(plane, 0, 255, out=plane)
+
+    return Image.fromarray(plane.astype(np.uint8), "L")
+
+
+def _base_layer_pil(W, H):
+    """Même base avec les primitives C de PIL (sans NumPy) ; grain non reproductible."""
+    import math
+    from PIL import Image, ImageChops
+
+    # Gradient 256×256 dont la valeur croît avec la distance au centre
+    grad = Image.radial_gradient("L")
+    R = 64                                # px du gradient par unité de distance
+    unit = grad.getpixel((128 + R, 128))  # valeur du gradient à dist = 1
+
+    base = Image.new("L", (W, H), 0)
+    for cx, cy, sx, sy, k, gain in _glows(W, H):
+        # Ré-échantillonner la zone du gradient correspondant à la fenêtre
+        box = (128 - cx / sx * R, 128 - cy / sy * R,
+               128 + (W - cx) / sx * R, 128 + (H - cy) / sy * R)
+        dist = grad.resize((W, H), Image.BILINEAR, box=box)
+        lut = [int(math.exp(-k * v / unit) * gain) for v in range(256)]
+        base = ImageChops.add(base, dist.point(lut))
+
+    # Grain gaussien centré sur 128 (σ ≈ écart-type de l'uniforme [-6, 6])
+    noise = Image.effect_noise((W, H), 3.7)
+    return ImageChops.add(base, noise, offset=-128)
+
+
+@functools.lru_cache(maxsize=1)
+def _arrow_mask(length, dash_len=6, gap_len=4):
+    """Masque L de la flèche pointillée (pointe à x = length, axe en y = 5),
+    rempli octet par octet puis collé d'un coup au lieu d'un draw.line par tiret."""
+    from PIL import Image
+
+    w, h = length + 1, 11
+    buf = bytearray(w * h)
+    # Tirets sur l'axe, jusqu'à 15 px avant la pointe
+    row, x = 5 * w, 0
+    while x < length - 15:
+        end = min(x + dash_len, length - 15)
+        buf[row + x:row + end + 1] = b"\xff" * (end - x + 1)
+        x += dash_len + gap_len
+    # Pointe : deux diagonales de 10 px, 1 px vertical tous les 2 px
+    for dx in range(11):
+        y = (dx + 1) // 2
+        buf[y * w + length - 10 + dx] = 255
+        buf[(h - 1 - y) * w + length - 10 + dx] = 255
+    return Image.frombytes("L", (w, h), bytes(buf))
 
-    # 1x — Finder affiche le PNG à la taille réelle en points
-    W, H = WIN_W, WIN_H  # 700 × 390
 
-    # ── Base noire + dual glow (profondeur 2026) ──
-    arr = np.zeros((H, W, 3), dtype=np.uint8)
-    y_c, x_c = np.mgrid[0:H, 0:W]
+@functools.lru_cache(maxsize=1)
+def generate_background():
+    # NumPy si présent (grain seedé, rendu reproductible), sinon PIL seul
+    backend = "numpy" if importlib.util.find_spec("numpy") else "pil"
 
-    # Glow 1 — large, très subtil (ambiance)
-    dist1 = np.sqrt(((x_c - W/2) / (W / 1.6))**2 + ((y_c - H/2) / (H / 1.2))**2)
-    glow1 = (np.exp(-dist1 * 2.0) * 10).astype(np.uint8)
+    # Le rendu ne dépend que du script et du backend : réutiliser le PNG d'un build précédent
+    out = f"/tmp/hean_dmg_background_{_build_key(backend)}.png"
+    if os.path.exists(out):
+        print(f"✅ Background en cache : {out}")
+        return out
 
-    # Glow 2 — concentré, légèrement plus fort (focus central)
-    dist2 = np.sqrt(((x_c - W/2) / (W / 3.0))**2 + ((y_c - H*0.45) / (H / 2.0))**2)
-    glow2 = (np.exp(-dist2 * 1.8) * 8).astype(np.uint8)
+    from PIL import ImageDraw
 
-    combined = np.clip(glow1.astype(np.int16) + glow2.astype(np.int16), 0, 255).astype(np.uint8)
-    arr[:, :, 0] = combined
-    arr[:, :, 1] = combined
-    arr[:, :, 2] = combined
+    # 1x — Finder affiche le PNG à la taille réelle en points
+    W, H = WIN_W, WIN_H  # 700 × 390
 
-    # Grain texturé (plus prononcé pour le côté tactile 2026)
-    rng = np.random.default_rng(42)
-    noise = rng.integers(-6, 7, (H, W, 3), dtype=np.int16)
-    arr = np.clip(arr.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+    # ── Base noire + dual glow + grain ──
+    if backend == "numpy":
+        base = _base_layer_numpy(W, H)
+    else:
+        base = _base_layer_pil(W, H)
 
-    img = Image.fromarray(arr, "RGB")
+    img = base.convert("RGB")
     draw = ImageDraw.Draw(img)
 
     # ── Flèche pointillée entre les icônes ──
     ax0, ax1, ay = 258, 445, APP_ICON_Y
     ARROW_COL = (100, 100, 100)
-    dash_len, gap_len = 6, 4
-    x = ax0
-    while x < ax1 - 15:
-        draw.line([(x, ay), (min(x + dash_len, ax1 - 15), ay)], fill=ARROW_COL, width=1)
-        x += dash_len + gap_len
-    tip = ax1
-    draw.line([(tip - 10, ay - 5), (tip, ay)], fill=ARROW_COL, width=1)
-    draw.line([(tip - 10, ay + 5), (tip, ay)], fill=ARROW_COL, width=1)
+    img.paste(ARROW_COL, (ax0, ay - 5), _arrow_mask(ax1 - ax0))
 
     # ── Textes ──
     try:
         from PIL import ImageFont
         fonts_mono = ["/System/Library/Fonts/Menlo.ttc", "/System/Library/Fonts/Monaco.ttf"]
         fonts_sans = ["/System/Library/Fonts/Helvetica.ttc", "/System/Library/Fonts/SFNSText.ttf"]
-        font_small = font_title = font_badge = None
-        for fpath in fonts_mono:
-            if os.path.exists(fpath):
-                font_small = ImageFont.truetype(fpath, 9)
-                font_badge = ImageFont.truetype(fpath, 7)
-                break
-        for fpath in fonts_sans:
-            if os.path.exists(fpath):
-                font_title = ImageFont.truetype(fpath, 11)
-                break
-        if not font_small:
-            font_small = ImageFont.load_default()
-        if not font_title:
-            font_title = font_small
-        if not font_badge:
-            font_badge = font_small
+        mono = next((f for f in fonts_mono if os.path.exists(f)), None)
+        sans = next((f for f in fonts_sans if os.path.exists(f)), None)
+        font_badge = _font(mono, 7) if mono else ImageFont.load_default()
+        # Le mono 9pt ne sert que de repli pour le titre
+        if sans:
+            font_title = _font(sans, 11)
+        elif mono:
+            font_title = _font(mono, 9)
+        else:
+            font_title = font_badge
 
         # Instruction sous la flèche
         TEXT_COL = (110, 110, 110)
         for i, txt in enumerate(["D R A G   T O   A P P L I C A T I O N S", "T O   I N S T A L L"]):
-            bbox = draw.textbbox((0, 0), txt, font=font_badge)
-            tw = bbox[2] - bbox[0]
+            tw = int(font_badge.getlength(txt))
             draw.text(((W - tw) // 2, ay + 16 + i * 12), txt, fill=TEXT_COL, font=font_badge)
 
         # "H E A N" watermark haut centré
         MARK_COL = (40, 40, 40)
-        bbox = draw.textbbox((0, 0), "H  E  A  N", font=font_title)
-        tw = bbox[2] - bbox[0]
+        tw = int(font_title.getlength("H  E  A  N"))
         draw.text(((W - tw) // 2, 20), "H  E  A  N", fill=MARK_COL, font=font_title)
 
         # Badges formats en bas à gauche
@@ -123,81 +207,113 @@ def generate_background():
 
         # Version bas à droite
         ver = "v 0 . 2 . 0 - b e t a . 1"
-        bbox = draw.textbbox((0, 0), ver, font=font_badge)
-        tw = bbox[2] - bbox[0]
+        tw = int(font_badge.getlength(ver))
         draw.text((W - tw - 20, H - 18), ver, fill=BADGE_COL, font=font_badge)
 
     except Exception as e:
         print(f"   (texte PIL non disponible : {e})")
-
-    out = "/tmp/hean_dmg_background.png"
-    img.save(out, "PNG")
+        # Rendu incomplet : hors cache, pour que le build suivant retente le texte
+        out = f"/tmp/hean_dmg_background_partial_{os.getpid()}.png"
+
+    # Écriture atomique : un build interrompu ne laisse pas de PNG tronqué en cache
+    tmp_out = f"{out}.{os.getpid()}.tmp"
+    # PNG éphémère relu une fois par hdiutil : pas la peine de compresser fort
+    img.save(tmp_out, "PNG", compress_level=1)
+    os.replace(tmp_out, out)
     print(f"✅ Background généré : {out}  ({W}×{H}px 1x)")
     return out
 
 
 # ─── 2. Créer le DMG avec background + AppleScript ────────────────────────────
-def build_dmg(bg_path):
-    staging = tempfile.mkdtemp(prefix="hean_dmg_")
-    rw_dmg  = "/tmp/hean_rw.dmg"
-    vol_name = "Hean"
-
-    try:
-        print("📦 Préparation du staging...")
-        # Copier l'app
-        app_dest = os.path.join(staging, "Hean.app")
-        if os.path.exists(app_dest):
-            shutil.rmtree(app_dest)
-        shutil.copytree(APP_PATH, app_dest)
-
-        # Symlink Applications
-        apps_link = os.path.join(staging, "Applications")
-        if os.path.exists(apps_link):
-            os.remove(apps_link)
-        os.symlink("/Applications", apps_link)
+def _clone(src, dst):
+    """Copie src → dst via clonefile(2) (APFS, copy-on-write), sinon copie classique."""
+    result = subprocess.run(["cp", "-cR", src, dst], capture_output=True)
+    if result.returncode == 0:
+        return
+    # Volume non-APFS : nettoyer une éventuelle copie partielle puis copier
+    if os.path.isdir(dst):
+        shutil.rmtree(dst)
+    elif os.path.exists(dst):
+        os.remove(dst)
+    if os.path.isdir(src):
+        shutil.copytree(src, dst)
+    else:
+        shutil.copy(src, dst)
+
+
+def _hdiutil(*args, capture=False):
+    """Lance hdiutil : stdout en direct (progression) sauf si `capture`, stderr
+    bufferisé et remonté seulement en cas d'échec. Retourne stdout capturé."""
+    proc = subprocess.Popen(
+        ["hdiutil", *args],
+        stdout=subprocess.PIPE if capture else None,
+        stderr=subprocess.PIPE,
+    )
+    out, err = proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(f"hdiutil {args[0]} a échoué : {err.decode(errors='replace').strip()}")
+    return out
 
-        # Dossier background (hidden)
-        bg_dir = os.path.join(staging, ".background")
-        os.makedirs(bg_dir, exist_ok=True)
-        shutil.copy(bg_path, os.path.join(bg_dir, "background.png"))
 
-        # Créer DMG inscriptible
-        print("💿 Création du DMG inscriptible...")
-        if os.path.exists(rw_dmg):
-            os.remove(rw_dmg)
-        subprocess.run([
-            "hdiutil", "create",
-            "-volname", vol_name,
-            "-srcfolder", staging,
-            "-ov", "-format", "UDRW",
-            rw_dmg
-        ], check=True, capture_output=True)
-
-        # Monter le DMG
-        print("🔧 Montage du DMG...")
-        result = subprocess.run(
-            ["hdiutil", "attach", rw_dmg, "-readwrite", "-noverify", "-noautoopen"],
-            check=True, capture_output=True, text=True
-        )
-        # Trouver le point de montage
-        mount_point = None
-        for line in result.stdout.split("\n"):
-            if "/Volumes/" in line:
-                parts = line.split("\t")
-                mount_point = parts[-1].strip()
-                break
-
-        if not mount_point:
-            raise RuntimeError("Impossible de trouver le point de montage")
-        print(f"   Monté sur : {mount_point}")
-
-        # Chemin POSIX vers le background dans le volume monté
-        bg_in_vol = os.path.join(mount_point, ".background", "background.png")
-        # Nom du volume (ex: "Noir" depuis "/Volumes/Noir")
-        disk_name = os.path.basename(mount_point)
-
-        # AppleScript — utilise le nom du volume directement
-        applescript = f"""
+def _wait_for_ds_store(mount_point, settle=0.3, timeout=4.0):
+    """Attend que le .DS_Store du volume existe et que (mtime, taille) soit resté
+    identique pendant au moins `settle` s d'observation. False si `timeout` atteint."""
+    ds_store = os.path.join(mount_point, ".DS_Store")
+    deadline = time.monotonic() + timeout
+    last = stable_since = None
+    while time.monotonic() < deadline:
+        try:
+            st = os.stat(ds_store)
+            sig = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            sig = None
+        now = time.monotonic()
+        if sig is None or sig != last:
+            # Absent ou modifié : on repart de zéro
+            last, stable_since = sig, now
+        elif now - stable_since >= settle:
+            return True
+        time.sleep(0.1)
+    return False
+
+
+def _style_with_finder(staging, vol_name, rw_dmg, ds_store_cache):
+    """Image UDRW montée + AppleScript Finder ; met en cache le .DS_Store produit."""
+    # Créer DMG inscriptible
+    print("💿 Création du DMG inscriptible...")
+    if os.path.exists(rw_dmg):
+        os.remove(rw_dmg)
+    _hdiutil(
+        "create",
+        "-volname", vol_name,
+        "-srcfolder", staging,
+        "-ov", "-format", "UDRW",
+        rw_dmg
+    )
+
+    # Monter le DMG
+    print("🔧 Montage du DMG...")
+    attach = plistlib.loads(_hdiutil(
+        "attach", rw_dmg, "-readwrite", "-noverify", "-noautoopen", "-plist",
+        capture=True
+    ))
+    # Trouver le point de montage
+    mount_point = next(
+        (e["mount-point"] for e in attach.get("system-entities", []) if "mount-point" in e),
+        None
+    )
+
+    if not mount_point:
+        raise RuntimeError("Impossible de trouver le point de montage")
+    print(f"   Monté sur : {mount_point}")
+
+    # Chemin POSIX vers le background dans le volume monté
+    bg_in_vol = os.path.join(mount_point, ".background", "background.png")
+    # Nom du volume (ex: "Noir" depuis "/Volumes/Noir")
+    disk_name = os.path.basename(mount_point)
+
+    # AppleScript — utilise le nom du volume directement
+    applescript = f"""
 tell application "Finder"
     tell disk "{disk_name}"
         open
@@ -211,44 +327,140 @@ tell application "Finder"
         set background picture of viewOptions to (POSIX file "{bg_in_vol}") as alias
         set position of item "Hean.app" of container window to {{{APP_ICON_X}, {APP_ICON_Y}}}
         set position of item "Applications" of container window to {{{APPS_ICON_X}, {APPS_ICON_Y}}}
-        close
-        open
         update without registering applications
-        delay 4
+        delay 0.5
         close
     end tell
 end tell
 """
-        print("🎨 Application du style via AppleScript...")
-        result = subprocess.run(["osascript", "-e", applescript], capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"⚠️  AppleScript warning: {result.stderr.strip()}")
-        else:
-            print("   ✓ Style appliqué")
+    print("🎨 Application du style via AppleScript...")
+    result = subprocess.run(["osascript", "-e", applescript], capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"⚠️  AppleScript warning: {result.stderr.strip()}")
+    else:
+        print("   ✓ Style appliqué")
+
+    # Attendre que Finder ait fini d'écrire le .DS_Store avant de démonter
+    ds_store_ok = _wait_for_ds_store(mount_point)
+    if not ds_store_ok:
+        print("⚠️  .DS_Store pas stabilisé, démontage quand même")
+
+    # Garder le .DS_Store pour les builds suivants (pas de mount/AppleScript)
+    ds_store = os.path.join(mount_point, ".DS_Store")
+    # Seulement si Finder a fini : un .DS_Store partiel resterait en cache jusqu'à
+    # la prochaine modification du script. Écriture atomique comme pour le PNG.
+    if result.returncode == 0 and ds_store_ok:
+        tmp_cache = f"{ds_store_cache}.{os.getpid()}.tmp"
+        shutil.copy(ds_store, tmp_cache)
+        os.replace(tmp_cache, ds_store_cache)
+        print(f"   ✓ .DS_Store mis en cache : {ds_store_cache}")
+    else:
+        print("   (.DS_Store non mis en cache)")
+
+    print("📤 Démontage...")
+    _hdiutil("detach", mount_point, "-force")
+
+
+def _report_dmg():
+    size_mb = os.path.getsize(OUT_DMG) / 1_048_576
+    print(f"\n✅ DMG final : {OUT_DMG}")
+    print(f"   Taille : {size_mb:.1f} MB")
+
+
+def _build_with_dmgbuild(dmgbuild, bg_path, vol_name):
+    """dmgbuild écrit le .DS_Store lui-même, sans Finder ni AppleScript. Il passe
+    quand même par une image inscriptible montée puis un hdiutil convert final."""
+    settings = {
+        "format": DMG_FORMAT,
+        # Comme côté hdiutil : niveau seulement pour zlib
+        "compression_level": ZLIB_LEVEL if DMG_FORMAT == "UDZO" else None,
+        "files": [APP_PATH],
+        "symlinks": {"Applications": "/Applications"},
+        "background": bg_path,
+        "window_rect": ((200, 100), (WIN_W, WIN_H)),
+        "default_view": "icon-view",
+        "show_toolbar": False,
+        "show_status_bar": False,
+        "arrange_by": None,
+        "icon_size": 88,
+        "icon_locations": {
+            "Hean.app": (APP_ICON_X, APP_ICON_Y),
+            "Applications": (APPS_ICON_X, APPS_ICON_Y),
+        },
+    }
+    print("💿 Création du DMG via dmgbuild...")
+    dmgbuild.build_dmg(OUT_DMG, vol_name, settings=settings)
+
+
+def build_dmg(bg_future):
+    """bg_future : Future du background, attendu seulement au moment de le copier."""
+    vol_name = "Hean"
+    try:
+        import dmgbuild
+    except ImportError:
+        dmgbuild = None
 
-        # Démonter
-        import time
-        time.sleep(2)
-        print("📤 Démontage...")
-        subprocess.run(["hdiutil", "detach", mount_point, "-force"], check=True, capture_output=True)
+    if dmgbuild is not None:
+        os.makedirs(os.path.dirname(OUT_DMG), exist_ok=True)
+        _build_with_dmgbuild(dmgbuild, bg_future.result(), vol_name)
+        _report_dmg()
+        return
+
+    staging = tempfile.mkdtemp(prefix="hean_dmg_")
+    rw_dmg  = "/tmp/hean_rw.dmg"
+    # Le .DS_Store encode fenêtre, positions et background : même clé que le PNG
+    ds_store_cache = f"/tmp/hean_dmg_DS_Store_{_build_key()}"
+    compress_args = ["-format", DMG_FORMAT]
+    if DMG_FORMAT == "UDZO":
+        compress_args += ["-imagekey", f"zlib-level={ZLIB_LEVEL}"]
+
+    try:
+        print("📦 Préparation du staging...")
+        # Copier l'app
+        app_dest = os.path.join(staging, "Hean.app")
+        _clone(APP_PATH, app_dest)
+
+        # Symlink Applications
+        apps_link = os.path.join(staging, "Applications")
+        os.symlink("/Applications", apps_link)
+
+        # Dossier background (hidden)
+        bg_dir = os.path.join(staging, ".background")
+        os.makedirs(bg_dir, exist_ok=True)
+        bg_path = bg_future.result()
+        _clone(bg_path, os.path.join(bg_dir, "background.png"))
 
-        # Convertir en DMG compressé final
-        print("🗜  Compression du DMG final...")
         os.makedirs(os.path.dirname(OUT_DMG), exist_ok=True)
         if os.path.exists(OUT_DMG):
             os.remove(OUT_DMG)
-        subprocess.run([
-            "hdiutil", "convert", rw_dmg,
-            "-format", "UDZO",
-            "-imagekey", "zlib-level=9",
-            "-o", OUT_DMG
-        ], check=True, capture_output=True)
-
-        # Cleanup
-        os.remove(rw_dmg)
-        size_mb = os.path.getsize(OUT_DMG) / 1_048_576
-        print(f"\n✅ DMG final : {OUT_DMG}")
-        print(f"   Taille : {size_mb:.1f} MB")
+
+        if os.path.exists(ds_store_cache):
+            # Style déjà connu : DMG compressé en une passe depuis le staging
+            print(f"🎨 Style en cache : {ds_store_cache}")
+            shutil.copy(ds_store_cache, os.path.join(staging, ".DS_Store"))
+            print("🗜  Création du DMG final...")
+            _hdiutil(
+                "create",
+                "-volname", vol_name,
+                "-srcfolder", staging,
+                "-ov", *compress_args,
+                OUT_DMG
+            )
+        else:
+            _style_with_finder(staging, vol_name, rw_dmg, ds_store_cache)
+
+            # Convertir en DMG compressé final
+            print("🗜  Compression du DMG final...")
+            _hdiutil(
+                "convert", rw_dmg,
+                *compress_args,
+                "-o", OUT_DMG
+            )
+
+            # Cleanup
+            os.remove(rw_dmg)
+
+        _report_dmg()
 
     finally:
         shutil.rmtree(staging, ignore_errors=True)
@@ -262,6 +474,13 @@ if __name__ == "__main__":
         print(f"❌ App introuvable : {APP_PATH}")
         sys.exit(1)
 
-    bg = generate_background()
-    build_dmg(bg)
+    # Pillow requis (numpy optionnel) : erreur immédiate plutôt qu'un pip install
+    if not importlib.util.find_spec("PIL"):
+        print(f"❌ Pillow introuvable : {sys.executable} -m pip install pillow numpy")
+        sys.exit(1)
+
+    # Background (NumPy/PIL) en parallèle du clone de l'app dans build_dmg
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        bg = pool.submit(generate_background)
+        build_dmg(bg)
     print("\n🎉 Terminé !")